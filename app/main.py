@@ -1,7 +1,13 @@
 from fastapi import FastAPI
+from etf.instrumentation import profiler
 
 app = FastAPI(title="ETF Lab")
 
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+@app.get("/metrics")
+def metrics():
+    """Timing aggregates and slow queries collected while ETF_PROFILE is set."""
+    return profiler.snapshot()
@@ -0,0 +1,3 @@
+from etf.cli import main
+
+raise SystemExit(main())
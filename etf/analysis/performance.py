@@ -1,17 +1,27 @@
+from etf.data.fx import CurrencyConverter
+from etf.data.panel import PricePanel
 from etf.data.repository import PriceRepository
 from etf.analysis.returns import ReturnsCalculator
 from etf.analysis.risk import RiskCalculator
+from etf.instrumentation import profiler
 from etf.models.etf import PerformanceMetrics
 
 
 class PerformanceAnalyzer:
-    """ETF performance analyzer."""
+    """ETF performance analyzer.
     
-    def __init__(self):
+    With ``base_currency`` prices are converted from each ETF's quote currency
+    before metrics are computed, so ETFs listed in different currencies
+    compare like for like.
+    """
+    
+    def __init__(self, base_currency: str | None = None):
         self.repo = PriceRepository()
         self.returns_calc = ReturnsCalculator()
         self.risk_calc = RiskCalculator()
+        self.converter = CurrencyConverter(base_currency) if base_currency else None
     
+    @profiler.timed("analysis.analyze_etf")
     def analyze_etf(self, ticker: str) -> PerformanceMetrics:
         """Perform complete performance analysis for an ETF."""
         df = self.repo.load_prices(ticker)
@@ -24,16 +34,29 @@ class PerformanceAnalyzer:
         if missing_cols:
             raise ValueError(f"Missing required columns: {missing_cols}")
         
-        df = self.returns_calc.cumulative_returns(df)
-        returns = df['daily_return'].dropna()
+        if self.converter:
+            df = self._to_base_currency(ticker, df)
+            if df.empty:
+                raise ValueError(f"No FX coverage for {ticker} in {self.converter.base}")
         
-        return PerformanceMetrics(
-            ticker=ticker,
-            total_return=df['cumulative_return'].iloc[-1],
-            annualized_return=self.returns_calc.annualized_return(df['cumulative_return'].iloc[-1], len(df)),
-            volatility=self.risk_calc.volatility(returns),
-            sharpe_ratio=self.risk_calc.sharpe_ratio(returns),
-            max_drawdown=self.risk_calc.max_drawdown(df['cumulative_return']),
-            period_start=df['date'].iloc[0].date(),
-            period_end=df['date'].iloc[-1].date()
-        )
\ No newline at end of file
+        with profiler.span("analysis.metrics"):
+            df = self.returns_calc.cumulative_returns(df)
+            returns = df['daily_return'].dropna()
+            
+            return PerformanceMetrics(
+                ticker=ticker,
+                total_return=df['cumulative_return'].iloc[-1],
+                annualized_return=self.returns_calc.annualized_return(df['cumulative_return'].iloc[-1], len(df)),
+                volatility=self.risk_calc.volatility(returns),
+                sharpe_ratio=self.risk_calc.sharpe_ratio(returns),
+                max_drawdown=self.risk_calc.max_drawdown(df['cumulative_return']),
+                period_start=df['date'].iloc[0].date(),
+                period_end=df['date'].iloc[-1].date()
+            )
+    
+    def _to_base_currency(self, ticker: str, df):
+        """Convert the close column into the base currency, dropping days before FX coverage."""
+        panel = PricePanel(df['date'].values.astype('datetime64[D]'), [ticker],
+                           df['close'].to_numpy(dtype=float)[:, None])
+        df['close'] = self.converter.convert(panel).values[:, 0]
+        return df.dropna(subset=['close']).reset_index(drop=True)
@@ -0,0 +1,42 @@
+"""Unified ``etf`` command line."""
+
+import argparse
+import importlib
+
+# Subcommand name -> module defining HELP, add_arguments(parser) and run(args)
+COMMANDS = {
+    "ingest": "etf.commands.ingest",
+    "analyze": "etf.commands.analyze",
+    "rank": "etf.commands.rank",
+    "visualize": "etf.commands.visualize",
+    "check": "etf.commands.check",
+    "metadata": "etf.commands.metadata",
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all subcommands."""
+    parser = argparse.ArgumentParser(prog="etf", description="ETF Analysis Lab")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--profile', action='store_true', help='Print timing aggregates on exit')
+    
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, module_name in COMMANDS.items():
+        module = importlib.import_module(module_name)
+        subparser = subparsers.add_parser(name, help=module.HELP, description=module.__doc__,
+                                          parents=[common])
+        module.add_arguments(subparser)
+        subparser.set_defaults(run=module.run)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.profile:
+        from etf.instrumentation import profiler
+        profiler.enable(report_at_exit=True)
+    return args.run(args) or 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,13 @@
+"""Subcommands of the ``etf`` command line.
+
+Command modules only import the standard library at module level. pandas,
+matplotlib, yfinance and the analysis stack are imported inside ``run`` so
+that building the parser, and cheap commands like ``check``, start fast.
+"""
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+UNIVERSE_FILES = {
+    "us": PROJECT_ROOT / "data/universes/universe_global_etf_core_v2_200.csv",
+    "ucits": PROJECT_ROOT / "data/universes/universe_ucits_eu_core_v1.csv",
+}
@@ -0,0 +1,51 @@
+"""Print row counts and the most recent prices stored in the database."""
+
+HELP = "Check database contents"
+
+
+def add_arguments(parser):
+    parser.add_argument('--recent', type=int, default=5, help='Recent records to show per ticker')
+    parser.add_argument('--show', type=int, default=3, help='Number of tickers to show recent records for')
+
+
+def run(args) -> int:
+    # Plain SQL through DuckDB keeps this command free of pandas imports
+    from storage.db import get_connection
+    from storage.schema import ensure_schema
+    
+    try:
+        ensure_schema()
+        con = get_connection()
+        try:
+            counts = con.execute(
+                "SELECT ticker, COUNT(*) FROM prices GROUP BY ticker ORDER BY ticker"
+            ).fetchall()
+            if not counts:
+                print("No data found in database.")
+                return 0
+            
+            print("Row counts by ticker:")
+            for ticker, count in counts:
+                print(f"  {ticker}: {count}")
+            
+            shown = [ticker for ticker, _ in counts[:args.show]]
+            recent = con.execute(f"""
+                SELECT ticker, date, close FROM prices
+                WHERE ticker IN ({", ".join("?" for _ in shown)})
+                QUALIFY row_number() OVER (PARTITION BY ticker ORDER BY date DESC) <= ?
+                ORDER BY ticker, date
+            """, [*shown, args.recent]).fetchall()
+        finally:
+            con.close()
+    except Exception as e:
+        print(f"Error checking database: {e}")
+        return 1
+    
+    print(f"\nRecent data (last {args.recent} records):")
+    current = None
+    for ticker, date, close in recent:
+        if ticker != current:
+            print(f"\n{ticker}:")
+            current = ticker
+        print(f"  {date} ${close:.2f}")
+    return 0
@@ -0,0 +1,92 @@
+"""Ingest ETF price data from Yahoo Finance."""
+
+import csv
+from pathlib import Path
+from etf.commands import UNIVERSE_FILES
+
+HELP = "Ingest prices from Yahoo Finance"
+DEFAULT_TICKERS = ["SPY", "VEA", "VWO"]
+
+
+def add_arguments(parser):
+    parser.add_argument('--us', action='store_true', help='Ingest the US ETF universe (200 tickers)')
+    parser.add_argument('--ucits', action='store_true', help='Ingest the European UCITS universe')
+    parser.add_argument('--tickers', nargs='+', help='Ingest explicit ticker symbols')
+    parser.add_argument('--fx', nargs='?', const='USD', metavar='BASE',
+                        help='Also ingest FX rates from every metadata currency into BASE (USD)')
+    parser.add_argument('--full', action='store_true', help='Full reload of all historical data')
+    parser.add_argument('--bulk', action='store_true', help='Write through the staged bulk path')
+    parser.add_argument('--resume', nargs='?', const='latest', metavar='RUN_ID',
+                        help='Resume an unfinished run (latest by default)')
+
+
+def load_tickers_from_csv(csv_path: Path) -> list[str]:
+    """Load ticker symbols from CSV file."""
+    with open(csv_path, newline='') as f:
+        reader = csv.DictReader(f)
+        if not reader.fieldnames or 'symbol' not in reader.fieldnames:
+            raise ValueError(f"CSV file {csv_path} missing 'symbol' column")
+        return [row['symbol'] for row in reader if row['symbol']]
+
+
+def metadata_fx_tickers(base: str) -> list[str]:
+    """FX tickers converting every currency in etf_metadata into ``base``."""
+    from etf.data.fx import fx_tickers_for
+    from storage.db import get_connection
+    from storage.schema import ensure_schema
+    
+    ensure_schema()
+    con = get_connection()
+    try:
+        currencies = [row[0] for row in con.execute(
+            "SELECT DISTINCT currency FROM etf_metadata WHERE currency IS NOT NULL"
+        ).fetchall()]
+    finally:
+        con.close()
+    return fx_tickers_for(currencies, base)
+
+
+def run(args) -> int:
+    from etf.data.ingestion import YahooFinanceIngester
+    
+    # Full reloads always go through the staged bulk path
+    bulk = args.full or args.bulk
+    ingester = YahooFinanceIngester()
+    
+    if args.resume:
+        run_id = None if args.resume == 'latest' else int(args.resume)
+        try:
+            ingester.resume_run(run_id, bulk=bulk)
+        except ValueError as e:
+            print(e)
+            return 1
+        print(f"\nResumed ingestion run {ingester.last_run_id} completed.")
+        return 0
+    
+    tickers = list(args.tickers or [])
+    for universe in ('us', 'ucits'):
+        if getattr(args, universe):
+            csv_path = UNIVERSE_FILES[universe]
+            if not csv_path.exists():
+                print(f"CSV file not found: {csv_path}")
+                return 1
+            universe_tickers = load_tickers_from_csv(csv_path)
+            print(f"Loaded {len(universe_tickers)} {universe.upper()} tickers from CSV")
+            tickers.extend(universe_tickers)
+    if not tickers and not args.fx:
+        # Default tickers for testing
+        tickers = DEFAULT_TICKERS
+    if args.fx:
+        fx_tickers = metadata_fx_tickers(args.fx)
+        print(f"Adding {len(fx_tickers)} FX series into {args.fx}: {', '.join(fx_tickers)}")
+        tickers.extend(fx_tickers)
+    tickers = list(dict.fromkeys(tickers))
+    
+    print(f"Ingesting {len(tickers)} tickers...")
+    ingester.ingest_tickers(tickers, incremental=not args.full, bulk=bulk)
+    
+    if args.full:
+        print("\nFull reload completed.")
+    else:
+        print("\nIncremental update completed. Use --full for complete reload.")
+    return 0
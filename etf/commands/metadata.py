@@ -0,0 +1,116 @@
+"""Populate, enrich and inspect ETF metadata."""
+
+import csv
+from etf.commands import UNIVERSE_FILES
+
+HELP = "Manage ETF metadata"
+
+
+def add_arguments(parser):
+    parser.add_argument('action', choices=['populate', 'enrich', 'show'],
+                        help='populate from universe CSVs, enrich from Yahoo Finance, or show rows')
+    parser.add_argument('--limit', type=int, default=10, help='Rows to show')
+
+
+def populate_metadata():
+    """Populate ETF metadata from universe CSV files."""
+    from storage.db import get_connection
+    from storage.schema import ensure_schema
+    
+    ensure_schema()
+    con = get_connection()
+    try:
+        for label, csv_path in [("US", UNIVERSE_FILES["us"]), ("UCITS", UNIVERSE_FILES["ucits"])]:
+            if not csv_path.exists():
+                continue
+            with open(csv_path, newline='') as f:
+                rows = [
+                    [row['symbol'], row.get('isin') or None, row['asset_class'],
+                     row['region'], row['category'], row['currency'], row['exchange']]
+                    for row in csv.DictReader(f)
+                ]
+            con.executemany("""
+                INSERT OR REPLACE INTO etf_metadata 
+                (ticker, isin, asset_class, region, category, currency, exchange)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            print(f"Loaded {len(rows)} {label} ETFs")
+        
+        print("Metadata population complete")
+    finally:
+        con.close()
+
+
+def enrich_metadata(delay: float = 0.5):
+    """Enrich ETF metadata descriptions from Yahoo Finance."""
+    import time
+    import yfinance as yf
+    from storage.db import get_connection
+    from storage.schema import ensure_schema
+    
+    ensure_schema()
+    con = get_connection()
+    
+    try:
+        # Get all tickers from metadata
+        tickers = con.execute("SELECT ticker FROM etf_metadata").fetchall()
+        
+        print(f"Enriching metadata for {len(tickers)} ETFs...")
+        
+        for (ticker,) in tickers:
+            try:
+                print(f"Fetching {ticker}...", end=" ")
+                info = yf.Ticker(ticker).info
+                
+                # Extract relevant fields
+                long_name = info.get('longName', '')
+                fund_family = info.get('fundFamily', '')
+                
+                # Update description if we got a long name
+                if long_name:
+                    description = f"{long_name} ({fund_family})" if fund_family else long_name
+                    con.execute("""
+                        UPDATE etf_metadata 
+                        SET description = ?
+                        WHERE ticker = ?
+                    """, [description, ticker])
+                    print(f"✓ {long_name}")
+                else:
+                    print("✗ No data")
+                
+                # Rate limiting
+                time.sleep(delay)
+                
+            except Exception as e:
+                print(f"✗ Error: {e}")
+                continue
+        
+        print("\nMetadata enrichment complete")
+        
+    finally:
+        con.close()
+
+
+def show_metadata(limit: int = 10):
+    """Print the first metadata rows."""
+    from storage.db import get_connection
+    
+    con = get_connection()
+    try:
+        result = con.execute(
+            "SELECT ticker, isin, description FROM etf_metadata LIMIT ?", [limit]
+        ).fetchall()
+        for row in result:
+            print(f"{row[0]}: ISIN={row[1]}, DESC={row[2]}")
+    finally:
+        con.close()
+
+
+def run(args) -> int:
+    if args.action == 'populate':
+        populate_metadata()
+    elif args.action == 'enrich':
+        enrich_metadata()
+    else:
+        show_metadata(args.limit)
+    return 0
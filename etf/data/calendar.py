@@ -0,0 +1,121 @@
+import numpy as np
+from storage.db import get_connection
+from storage.schema import ensure_schema
+
+# Exchange used for tickers without an `etf_metadata.exchange` entry
+UNKNOWN_EXCHANGE = "UNKNOWN"
+
+
+class TradingCalendar:
+    """Sorted set of trading dates with vectorized date -> day position lookup."""
+
+    def __init__(self, dates):
+        self.dates = np.unique(np.asarray(dates, dtype="datetime64[D]"))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def positions(self, dates) -> np.ndarray:
+        """Map dates to day positions; dates not on the calendar map to -1."""
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        if len(self.dates) == 0:
+            return np.full(len(dates), -1)
+        positions = np.minimum(np.searchsorted(self.dates, dates), len(self.dates) - 1)
+        return np.where(self.dates[positions] == dates, positions, -1)
+
+    def between(self, start=None, end=None) -> "TradingCalendar":
+        """Restrict the calendar to ``start <= date <= end``."""
+        mask = np.ones(len(self.dates), dtype=bool)
+        if start is not None:
+            mask &= self.dates >= np.datetime64(str(start)[:10], "D")
+        if end is not None:
+            mask &= self.dates <= np.datetime64(str(end)[:10], "D")
+        return TradingCalendar(self.dates[mask])
+
+    @staticmethod
+    def union(calendars: list["TradingCalendar"]) -> "TradingCalendar":
+        """Calendar of dates on which any of ``calendars`` trades."""
+        if not calendars:
+            return TradingCalendar([])
+        return TradingCalendar(np.concatenate([c.dates for c in calendars]))
+
+
+class ExchangeCalendars:
+    """Precomputed per-exchange trading calendars derived from stored prices.
+
+    An exchange trades on a date if any of its tickers (by
+    ``etf_metadata.exchange``) has a bar on it. Calendars live in the
+    ``exchange_calendars`` table and are cached per process after first use.
+    """
+
+    def __init__(self):
+        ensure_schema()
+        self._calendars: dict[str, TradingCalendar] | None = None
+
+    def refresh(self):
+        """Rebuild the stored calendars from the prices table."""
+        con = get_connection()
+        try:
+            self._rebuild(con)
+        finally:
+            con.close()
+        self._calendars = None
+
+    @staticmethod
+    def _rebuild(con):
+        con.execute("BEGIN TRANSACTION")
+        con.execute("DELETE FROM exchange_calendars")
+        con.execute("""
+            INSERT INTO exchange_calendars
+            SELECT DISTINCT COALESCE(m.exchange, ?) AS exchange, p.date
+            FROM prices p
+            LEFT JOIN etf_metadata m ON m.ticker = p.ticker
+            ORDER BY exchange, date
+        """, [UNKNOWN_EXCHANGE])
+        con.execute("COMMIT")
+
+    def calendars(self) -> dict[str, TradingCalendar]:
+        """Get every exchange calendar, building them on first use."""
+        if self._calendars is None:
+            con = get_connection()
+            try:
+                if con.execute("SELECT COUNT(*) FROM exchange_calendars").fetchone()[0] == 0:
+                    self._rebuild(con)
+                result = con.execute(
+                    "SELECT exchange, date FROM exchange_calendars ORDER BY exchange, date"
+                ).fetchnumpy()
+            finally:
+                con.close()
+            exchanges = result["exchange"]
+            dates = result["date"].astype("datetime64[D]")
+            self._calendars = {
+                exchange: TradingCalendar(dates[exchanges == exchange])
+                for exchange in np.unique(exchanges)
+            }
+        return self._calendars
+
+    def calendar(self, exchange: str) -> TradingCalendar:
+        """Get the calendar of one exchange."""
+        calendars = self.calendars()
+        if exchange not in calendars:
+            raise ValueError(f"Unknown exchange: {exchange}")
+        return calendars[exchange]
+
+    def union(self, exchanges: list[str] | None = None) -> TradingCalendar:
+        """Union calendar of ``exchanges`` (all exchanges by default)."""
+        calendars = self.calendars()
+        names = calendars if exchanges is None else [e for e in exchanges if e in calendars]
+        return TradingCalendar.union([calendars[name] for name in names])
+
+    def exchanges_for(self, tickers: list[str]) -> dict[str, str]:
+        """Map tickers to their exchange."""
+        con = get_connection()
+        try:
+            rows = con.execute("""
+                SELECT t.ticker, COALESCE(m.exchange, ?)
+                FROM (SELECT unnest(?::TEXT[]) AS ticker) t
+                LEFT JOIN etf_metadata m ON m.ticker = t.ticker
+            """, [UNKNOWN_EXCHANGE, list(tickers)]).fetchall()
+            return dict(rows)
+        finally:
+            con.close()
@@ -0,0 +1,130 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+from etf.data.panel import PanelLoader, PricePanel
+from etf.instrumentation import profiler
+from storage.db import get_connection
+
+# Quote currencies expressed in minor units: currency -> (major currency, scale)
+MINOR_UNITS = {'GBp': ('GBP', 0.01), 'GBX': ('GBP', 0.01)}
+
+
+def fx_ticker(currency: str, base: str) -> str:
+    """Yahoo Finance ticker quoting ``base`` per unit of ``currency`` (e.g. EURUSD=X)."""
+    return f"{currency}{base}=X"
+
+
+def is_fx_ticker(ticker: str) -> bool:
+    return ticker.endswith("=X")
+
+
+def major_currency(currency: str) -> tuple[str, float]:
+    """Split a quote currency into its major currency and the scale to apply."""
+    return MINOR_UNITS.get(currency, (currency, 1.0))
+
+
+def fx_tickers_for(currencies: list[str], base: str) -> list[str]:
+    """FX tickers needed to convert prices quoted in ``currencies`` into ``base``."""
+    majors = sorted({major_currency(c)[0] for c in currencies if c} - {base})
+    return [fx_ticker(currency, base) for currency in majors]
+
+
+class CurrencyConverter:
+    """Converts price panels into a base currency using FX series from the price store.
+
+    FX rates are stored as ordinary tickers (``EURUSD=X`` and friends), so they
+    are ingested like any other series. Conversion looks up the ticker
+    currencies in ``etf_metadata``, loads every needed FX series in one query,
+    aligns each onto the panel dates as of the latest fixing, and scales all
+    columns of a currency with one broadcast multiply. Converted panels are
+    cached by content.
+    """
+
+    def __init__(self, base: str = 'USD', loader: PanelLoader | None = None, cache_size: int = 16):
+        self.base = base
+        self.loader = loader or PanelLoader()
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+
+    def currencies(self, tickers: list[str]) -> dict[str, str]:
+        """Quote currency per ticker; tickers without metadata are assumed to be in the base currency."""
+        con = get_connection()
+        try:
+            rows = dict(con.execute("""
+                SELECT ticker, currency FROM etf_metadata
+                WHERE ticker IN (SELECT unnest(?::TEXT[])) AND currency IS NOT NULL
+            """, [list(tickers)]).fetchall())
+        finally:
+            con.close()
+        return {ticker: rows.get(ticker, self.base) for ticker in tickers}
+
+    @profiler.timed("fx.convert")
+    def convert(self, panel: PricePanel) -> PricePanel:
+        """Return ``panel`` with every column expressed in the base currency."""
+        key = self._cache_key(panel)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        currencies = self.currencies(panel.tickers)
+        groups: dict[str, list[int]] = {}
+        scales = np.ones(len(panel.tickers))
+        for column, ticker in enumerate(panel.tickers):
+            major, scale = major_currency(currencies[ticker])
+            scales[column] = scale
+            if major != self.base:
+                groups.setdefault(major, []).append(column)
+
+        values = panel.values * scales
+        if groups and len(panel):
+            rates = self.rates(list(groups), panel.dates)
+            for currency, columns in groups.items():
+                values[:, columns] *= rates[currency][:, None]
+
+        converted = PricePanel(panel.dates, list(panel.tickers), values)
+        self._cache[key] = converted
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return converted
+
+    def clear_cache(self):
+        """Drop cached conversions, e.g. after FX series were re-ingested."""
+        self._cache.clear()
+
+    def load(self, tickers: list[str] | None = None, **panel_options) -> PricePanel:
+        """Load a panel through the loader and convert it to the base currency."""
+        return self.convert(self.loader.load(tickers, **panel_options))
+
+    def rates(self, currencies: list[str], dates: np.ndarray) -> dict[str, np.ndarray]:
+        """Base-currency value of one unit of each currency as of each date.
+
+        Uses the direct pair (``EURUSD=X``) when stored and the inverted pair
+        (``USDEUR=X``) otherwise; dates before the first fixing are NaN.
+        """
+        dates = np.asarray(dates, dtype='datetime64[D]')
+        direct = [fx_ticker(currency, self.base) for currency in currencies]
+        inverse = [fx_ticker(self.base, currency) for currency in currencies]
+        # A week of lead-in so the first panel date has a fixing to carry forward
+        fx_panel = self.loader.load(direct + inverse, start=dates[0] - np.timedelta64(7, 'D'),
+                                    end=dates[-1], fill='ffill')
+
+        asof = np.searchsorted(fx_panel.dates, dates, side='right') - 1
+        before_first = asof < 0
+        asof[before_first] = 0
+
+        rates = {}
+        for currency, pair, inverted in zip(currencies, direct, inverse):
+            series = fx_panel.column(pair)
+            if np.isnan(series).all():
+                series = 1.0 / fx_panel.column(inverted)
+            if np.isnan(series).all():
+                raise ValueError(f"No FX series stored for {currency}/{self.base}: ingest {pair}")
+            rate = series[asof]
+            rate[before_first] = np.nan
+            rates[currency] = rate
+        return rates
+
+    def _cache_key(self, panel: PricePanel) -> tuple:
+        digest = hashlib.blake2b(np.ascontiguousarray(panel.values).tobytes(), digest_size=16)
+        digest.update(np.ascontiguousarray(panel.dates).tobytes())
+        return (self.base, tuple(panel.tickers), digest.hexdigest())
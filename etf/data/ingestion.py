@@ -1,19 +1,33 @@
+import heapq
+import random
 import time
 import yfinance as yf
 import pandas as pd
 import logging
+from collections import deque
 from datetime import datetime, timedelta
+from etf.data.calendar import ExchangeCalendars
+from etf.data.manifest import IngestionManifest
+from etf.instrumentation import profiler
+from etf.models.etf import PriceChangeSummary
 
 
 class YahooFinanceIngester:
     """Yahoo Finance data ingester."""
     
-    def __init__(self, delay: float = 1.0):
+    def __init__(self, delay: float = 1.0, max_attempts: int = 3,
+                 retry_base_delay: float = 2.0, retry_max_delay: float = 60.0):
         self.delay = delay
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.last_run_id = None
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
-    def fetch_prices(self, ticker: str, period: str = "10y", start_date: str = None) -> pd.DataFrame:
+    @profiler.timed("ingestion.fetch_prices")
+    def fetch_prices(self, ticker: str, period: str = "10y", start_date: str = None,
+                     raise_errors: bool = False) -> pd.DataFrame:
         """Fetch price data from Yahoo Finance."""
         try:
             if start_date:
@@ -44,21 +58,114 @@ class YahooFinanceIngester:
                 "close", "adj_close", "volume"
             ]]
         except Exception as e:
+            if raise_errors:
+                raise
             self.logger.error(f"Error fetching data for {ticker}: {e}")
             return pd.DataFrame()
     
-    def ingest_tickers(self, tickers: list[str], incremental: bool = True):
-        """Ingest multiple tickers with optional incremental loading."""
-        from etf.data.repository import PriceRepository
+    def retry_delay(self, attempt: int) -> float:
+        """Exponential backoff delay with jitter before retry number ``attempt``."""
+        delay = min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+        return delay * random.uniform(0.5, 1.0)
+    
+    def ingest_tickers(self, tickers: list[str], incremental: bool = True,
+                       bulk: bool = False, batch_size: int = 100,
+                       log_revisions: bool = True) -> dict[str, PriceChangeSummary]:
+        """Ingest multiple tickers with optional incremental loading.
         
+        Every call is recorded as a run in the ingestion manifest so that it
+        can be picked up with ``resume_run`` if it dies part way. In bulk mode
+        fetched frames are buffered and written ``batch_size`` tickers at a
+        time through ``PriceRepository.bulk_save_prices``; a full reload also
+        defers primary key maintenance until each batch is loaded.
+        Returns the new/updated/unchanged row counts of every written ticker.
+        """
         if not tickers:
             self.logger.warning("No tickers provided for ingestion")
-            return
+            return {}
         
+        manifest = IngestionManifest()
+        run_id = manifest.create_run(tickers, incremental)
+        self.logger.info(f"Started ingestion run {run_id} for {len(tickers)} tickers")
+        return self._execute_run(manifest, run_id, incremental, bulk, batch_size, log_revisions)
+    
+    def resume_run(self, run_id: int | None = None, bulk: bool = False, batch_size: int = 100,
+                   log_revisions: bool = True) -> dict[str, PriceChangeSummary]:
+        """Finish the outstanding and failed tasks of a previous run (latest unfinished by default)."""
+        manifest = IngestionManifest()
+        if run_id is None:
+            run_id = manifest.latest_unfinished_run()
+        run = manifest.get_run(run_id) if run_id is not None else None
+        if run is None:
+            raise ValueError(f"No ingestion run to resume: {run_id}")
+        
+        self.logger.info(f"Resuming ingestion run {run_id}")
+        return self._execute_run(manifest, run_id, run['incremental'], bulk, batch_size, log_revisions)
+    
+    def _execute_run(self, manifest: IngestionManifest, run_id: int, incremental: bool,
+                     bulk: bool, batch_size: int, log_revisions: bool) -> dict[str, PriceChangeSummary]:
+        """Work through the outstanding tasks of a run, retrying failures with backoff."""
+        from etf.data.repository import PriceRepository
+        
+        self.last_run_id = run_id
         repo = PriceRepository()
-        success_count = 0
+        queue = deque(ticker for ticker, _ in manifest.outstanding_tasks(run_id))
+        retries = []
+        tries = {ticker: 0 for ticker in queue}
+        changes = {}
+        pending = {}
+        loaded_rows = 0
+        load_seconds = 0.0
+        
+        def fail(ticker: str, error: str):
+            if tries[ticker] < self.max_attempts:
+                wait = self.retry_delay(tries[ticker])
+                heapq.heappush(retries, (time.monotonic() + wait, ticker))
+                manifest.fail_task(run_id, ticker, error, datetime.now() + timedelta(seconds=wait))
+                self.logger.warning(f"Failed to ingest {ticker}: {error} (retrying in {wait:.1f}s)")
+            else:
+                manifest.fail_task(run_id, ticker, error, None)
+                self.logger.error(f"Failed to ingest {ticker} after {tries[ticker]} attempts: {error}")
         
-        for ticker in tickers:
+        def flush():
+            nonlocal loaded_rows, load_seconds
+            staged = list(pending)
+            frames = list(pending.values())
+            pending.clear()
+            try:
+                stats = repo.bulk_save_prices(frames, defer_index=not incremental,
+                                              log_revisions=log_revisions)
+            except Exception as e:
+                for ticker in staged:
+                    fail(ticker, f"bulk write failed: {e}")
+                return
+            loaded_rows += stats.rows
+            load_seconds += stats.seconds
+            self.logger.info(
+                f"  ✓ Bulk loaded {stats.rows} rows for {stats.tickers} tickers "
+                f"({stats.rows_per_second:,.0f} rows/s)"
+            )
+            changes.update(stats.changes)
+            for ticker in staged:
+                summary = stats.changes.get(ticker)
+                manifest.complete_task(run_id, ticker, summary.new + summary.updated if summary else 0)
+        
+        while queue or retries or pending:
+            if retries and (not queue or retries[0][0] <= time.monotonic()):
+                if pending:
+                    # Write what is staged before waiting on a retry
+                    flush()
+                    continue
+                due_at, ticker = heapq.heappop(retries)
+                time.sleep(max(0.0, due_at - time.monotonic()))
+            elif queue:
+                ticker = queue.popleft()
+            else:
+                flush()
+                continue
+            
+            tries[ticker] += 1
+            manifest.start_task(run_id, ticker)
             try:
                 self.logger.info(f"Ingesting {ticker}...")
                 
@@ -73,21 +180,42 @@ class YahooFinanceIngester:
                         start_date = (datetime.fromisoformat(latest_date) + timedelta(days=1)).strftime("%Y-%m-%d")
                         self.logger.info(f"  Starting from {start_date}")
                 
-                df = self.fetch_prices(ticker, start_date=start_date)
+                df = self.fetch_prices(ticker, start_date=start_date, raise_errors=True)
 
                 if df.empty:
                     self.logger.warning(f"  No new data for {ticker}")
+                    manifest.complete_task(run_id, ticker, 0)
                     continue
 
-                repo.save_prices(df)
-                self.logger.info(f"  ✓ {len(df)} rows saved for {ticker}")
-                success_count += 1
+                if bulk:
+                    pending[ticker] = df
+                    manifest.stage_task(run_id, ticker)
+                    self.logger.info(f"  ✓ {len(df)} rows staged for {ticker}")
+                    if len(pending) >= batch_size:
+                        flush()
+                else:
+                    summary = repo.save_prices(df, log_revisions=log_revisions).get(ticker)
+                    changes[ticker] = summary
+                    manifest.complete_task(run_id, ticker, summary.new + summary.updated)
+                    self.logger.info(f"  ✓ {ticker}: {summary.new} new, {summary.updated} updated, "
+                                     f"{summary.unchanged} unchanged")
                 
                 if self.delay > 0:
                     time.sleep(self.delay)
                 
             except Exception as e:
-                self.logger.error(f"Failed to ingest {ticker}: {e}")
-                continue
+                fail(ticker, str(e))
+        
+        if load_seconds > 0:
+            self.logger.info(f"Bulk load: {loaded_rows} rows in {load_seconds:.2f}s "
+                             f"({loaded_rows / load_seconds:,.0f} rows/s)")
+        
+        if any(summary.changed for summary in changes.values() if summary):
+            ExchangeCalendars().refresh()
         
-        self.logger.info(f"Ingestion completed: {success_count}/{len(tickers)} tickers successful")
\ No newline at end of file
+        summary = manifest.finish_run(run_id)
+        self.logger.info(
+            f"Ingestion run {run_id} completed: {summary.get('succeeded', 0)}/{sum(summary.values())} "
+            f"tickers successful"
+        )
+        return changes
@@ -0,0 +1,134 @@
+from datetime import datetime
+from storage.db import get_connection
+from storage.schema import ensure_schema
+
+# Task states that still need work when a run is resumed
+OUTSTANDING_STATUSES = ('pending', 'running', 'staged', 'retrying', 'failed')
+
+
+class IngestionManifest:
+    """Persisted record of ingestion runs and their per-ticker tasks."""
+
+    def __init__(self):
+        ensure_schema()
+
+    def create_run(self, tickers: list[str], incremental: bool) -> int:
+        """Register a new run with one pending task per ticker."""
+        tickers = list(dict.fromkeys(tickers))
+        con = get_connection()
+        try:
+            run_id = con.execute("""
+                INSERT INTO ingestion_runs (run_id, started_at, status, incremental, ticker_count)
+                VALUES (nextval('ingestion_run_seq'), current_timestamp, 'running', ?, ?)
+                RETURNING run_id
+            """, [incremental, len(tickers)]).fetchone()[0]
+            con.executemany("""
+                INSERT INTO ingestion_tasks (run_id, ticker, status, attempts, rows_written)
+                VALUES (?, ?, 'pending', 0, 0)
+            """, [[run_id, ticker] for ticker in tickers])
+            return run_id
+        finally:
+            con.close()
+
+    def get_run(self, run_id: int) -> dict | None:
+        """Get run header fields."""
+        con = get_connection()
+        try:
+            row = con.execute("""
+                SELECT run_id, started_at, finished_at, status, incremental, ticker_count
+                FROM ingestion_runs WHERE run_id = ?
+            """, [run_id]).fetchone()
+        finally:
+            con.close()
+        if row is None:
+            return None
+        keys = ['run_id', 'started_at', 'finished_at', 'status', 'incremental', 'ticker_count']
+        return dict(zip(keys, row))
+
+    def latest_unfinished_run(self) -> int | None:
+        """Get the id of the most recent run that did not complete."""
+        con = get_connection()
+        try:
+            row = con.execute("""
+                SELECT MAX(run_id) FROM ingestion_runs WHERE status <> 'completed'
+            """).fetchone()
+            return row[0] if row else None
+        finally:
+            con.close()
+
+    def outstanding_tasks(self, run_id: int) -> list[tuple[str, int]]:
+        """Get (ticker, attempts) for tasks of a run that have not succeeded."""
+        placeholders = ", ".join("?" for _ in OUTSTANDING_STATUSES)
+        con = get_connection()
+        try:
+            return [tuple(row) for row in con.execute(f"""
+                SELECT ticker, attempts FROM ingestion_tasks
+                WHERE run_id = ? AND status IN ({placeholders})
+                ORDER BY COALESCE(next_attempt_at, TIMESTAMP '1970-01-01'), ticker
+            """, [run_id, *OUTSTANDING_STATUSES]).fetchall()]
+        finally:
+            con.close()
+
+    def start_task(self, run_id: int, ticker: str):
+        """Mark a task as running and count the attempt."""
+        self._update_task(run_id, ticker, """
+            status = 'running', attempts = attempts + 1,
+            started_at = current_timestamp, finished_at = NULL, next_attempt_at = NULL
+        """)
+
+    def stage_task(self, run_id: int, ticker: str):
+        """Mark a task as fetched and waiting for a bulk write."""
+        self._update_task(run_id, ticker, "status = 'staged'")
+
+    def complete_task(self, run_id: int, ticker: str, rows_written: int):
+        """Mark a task as succeeded."""
+        self._update_task(run_id, ticker, """
+            status = 'succeeded', rows_written = ?, last_error = NULL,
+            finished_at = current_timestamp,
+            duration_seconds = epoch(current_timestamp - started_at)
+        """, [rows_written])
+
+    def fail_task(self, run_id: int, ticker: str, error: str, retry_at: datetime | None):
+        """Mark a task as failed, scheduling a retry unless ``retry_at`` is None."""
+        status = 'retrying' if retry_at else 'failed'
+        self._update_task(run_id, ticker, """
+            status = ?, last_error = ?, next_attempt_at = ?,
+            finished_at = current_timestamp,
+            duration_seconds = epoch(current_timestamp - started_at)
+        """, [status, error, retry_at])
+
+    def finish_run(self, run_id: int) -> dict[str, int]:
+        """Close a run and return its task counts by status."""
+        summary = self.task_summary(run_id)
+        status = 'completed' if set(summary) <= {'succeeded'} else 'incomplete'
+        con = get_connection()
+        try:
+            con.execute("""
+                UPDATE ingestion_runs SET status = ?, finished_at = current_timestamp
+                WHERE run_id = ?
+            """, [status, run_id])
+        finally:
+            con.close()
+        return summary
+
+    def task_summary(self, run_id: int) -> dict[str, int]:
+        """Count tasks of a run by status."""
+        con = get_connection()
+        try:
+            rows = con.execute("""
+                SELECT status, COUNT(*) FROM ingestion_tasks
+                WHERE run_id = ? GROUP BY status ORDER BY status
+            """, [run_id]).fetchall()
+            return dict(rows)
+        finally:
+            con.close()
+
+    def _update_task(self, run_id: int, ticker: str, assignments: str, params: list | None = None):
+        con = get_connection()
+        try:
+            con.execute(
+                f"UPDATE ingestion_tasks SET {assignments} WHERE run_id = ? AND ticker = ?",
+                [*(params or []), run_id, ticker]
+            )
+        finally:
+            con.close()
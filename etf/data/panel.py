@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from etf.data.calendar import ExchangeCalendars
+from etf.instrumentation import profiler
+from storage.db import get_connection
+
+PANEL_FIELDS = ('open', 'high', 'low', 'close', 'adj_close', 'volume')
+FILL_POLICIES = ('none', 'ffill')
+
+
+@dataclass
+class PricePanel:
+    """Prices of many tickers aligned on shared integer day positions.
+
+    ``values[i, j]`` is the price of ``tickers[j]`` on ``dates[i]``; NaN
+    marks days without a price after the fill policy was applied.
+    """
+    dates: np.ndarray
+    tickers: list[str]
+    values: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def column(self, ticker: str) -> np.ndarray:
+        """Get the aligned price series of one ticker."""
+        return self.values[:, self.tickers.index(ticker)]
+
+    def select(self, tickers: list[str]) -> "PricePanel":
+        """Get a panel restricted to ``tickers`` (in that order)."""
+        columns = [self.tickers.index(ticker) for ticker in tickers]
+        return PricePanel(self.dates, list(tickers), self.values[:, columns])
+
+    def returns(self) -> np.ndarray:
+        """Simple returns matrix; the first row and days without prices are NaN."""
+        returns = np.full_like(self.values, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(self.values[1:], self.values[:-1], out=returns[1:])
+        returns[1:] -= 1
+        return returns
+
+    def log_returns(self) -> np.ndarray:
+        """Log returns matrix; the first row and days without prices are NaN."""
+        log_returns = np.full_like(self.values, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_prices = np.log(self.values)
+        np.subtract(log_prices[1:], log_prices[:-1], out=log_returns[1:])
+        return log_returns
+
+    def to_frame(self) -> pd.DataFrame:
+        """Wide DataFrame indexed by date with one column per ticker."""
+        return pd.DataFrame(self.values, index=pd.DatetimeIndex(self.dates, name='date'),
+                            columns=self.tickers)
+
+
+def forward_fill(values: np.ndarray, limit: int | None = None) -> np.ndarray:
+    """Carry the last valid value of each column forward, at most ``limit`` days."""
+    rows = np.arange(len(values))[:, None]
+    last_valid = np.where(~np.isnan(values), rows, 0)
+    np.maximum.accumulate(last_valid, axis=0, out=last_valid)
+    filled = np.take_along_axis(values, last_valid, axis=0)
+    if limit is not None:
+        filled[rows - last_valid > limit] = np.nan
+    return filled
+
+
+class PanelLoader:
+    """Loads aligned multi-ticker price panels.
+
+    Each stored bar is mapped onto a day position of a shared calendar (the
+    union of the tickers' exchange calendars by default, or one exchange's
+    calendar) and scattered into a dense matrix, so cross-ticker math works
+    on array positions rather than per-pair date joins.
+    """
+
+    def __init__(self, calendars: ExchangeCalendars | None = None):
+        self.calendars = calendars or ExchangeCalendars()
+
+    @profiler.timed("panel.load")
+    def load(self, tickers: list[str] | None = None, field: str = 'close',
+             start=None, end=None, calendar: str = 'union',
+             fill: str = 'ffill', fill_limit: int | None = None) -> PricePanel:
+        """Load ``field`` for ``tickers`` (all stored tickers by default) as a PricePanel.
+
+        ``calendar`` is ``'union'`` or the name of an exchange whose trading
+        days define the rows. ``fill`` is ``'ffill'`` to carry prices over
+        days a ticker did not trade (at most ``fill_limit`` days) or
+        ``'none'`` to leave them NaN.
+        """
+        if field not in PANEL_FIELDS:
+            raise ValueError(f"Unknown price field: {field}")
+        if fill not in FILL_POLICIES:
+            raise ValueError(f"Unknown fill policy: {fill}")
+        if tickers is not None:
+            tickers = list(dict.fromkeys(tickers))
+
+        ticker_ids, dates, values, tickers = self._load_long(tickers, field, start, end)
+
+        if calendar == 'union':
+            exchanges = set(self.calendars.exchanges_for(tickers).values())
+            shared = self.calendars.union(list(exchanges)).between(start, end)
+            positions = shared.positions(dates)
+            if (positions < 0).any():
+                # Bars newer than the precomputed calendars: rebuild once
+                self.calendars.refresh()
+                shared = self.calendars.union(list(exchanges)).between(start, end)
+                positions = shared.positions(dates)
+        else:
+            shared = self.calendars.calendar(calendar).between(start, end)
+            positions = shared.positions(dates)
+
+        matrix = np.full((len(shared), len(tickers)), np.nan)
+        on_calendar = positions >= 0
+        matrix[positions[on_calendar], ticker_ids[on_calendar]] = values[on_calendar]
+
+        if fill == 'ffill':
+            matrix = forward_fill(matrix, fill_limit)
+        return PricePanel(shared.dates, tickers, matrix)
+
+    @staticmethod
+    def _load_long(tickers: list[str] | None, field: str, start, end):
+        """Fetch (ticker id, date, value) columns as NumPy arrays."""
+        conditions, params = [], []
+        if tickers is not None:
+            conditions.append("ticker IN (SELECT unnest(?::TEXT[]))")
+            params.append(list(tickers))
+        if start is not None:
+            conditions.append("date >= ?")
+            params.append(str(start)[:10])
+        if end is not None:
+            conditions.append("date <= ?")
+            params.append(str(end)[:10])
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        con = get_connection()
+        try:
+            result = profiler.execute(con, f"""
+                SELECT ticker, date, CAST({field} AS DOUBLE) AS value
+                FROM prices {where}
+                ORDER BY ticker, date
+            """, params, name="sql.panel_load").fetchnumpy()
+        finally:
+            con.close()
+
+        stored, ticker_ids = np.unique(result['ticker'], return_inverse=True)
+        if tickers is None:
+            tickers = list(stored)
+        else:
+            # Keep the caller's ticker order, including tickers without data
+            order = {ticker: i for i, ticker in enumerate(tickers)}
+            remap = np.array([order[ticker] for ticker in stored], dtype=np.intp)
+            ticker_ids = remap[ticker_ids]
+        values = np.ma.filled(result['value'], np.nan)
+        return ticker_ids, result['date'].astype('datetime64[D]'), values, list(tickers)
@@ -1,6 +1,13 @@
+import time
 import pandas as pd
+from etf.instrumentation import profiler
+from etf.models.etf import BulkLoadStats, PriceChangeSummary
 from storage.db import get_connection
-from storage.schema import ensure_schema
+from storage.schema import AGGREGATE_TABLES, create_prices_table, ensure_schema, refresh_aggregates
+
+PRICE_COLUMNS = ['ticker', 'date', 'open', 'high', 'low', 'close', 'adj_close', 'volume']
+VALUE_FIELDS = PRICE_COLUMNS[2:]
+VALUE_COLUMNS = ", ".join(PRICE_COLUMNS)
 
 
 class PriceRepository:
@@ -9,8 +16,9 @@ class PriceRepository:
     def __init__(self):
         ensure_schema()
     
-    def save_prices(self, df: pd.DataFrame):
-        """Save price data to database."""
+    @staticmethod
+    def _validate_prices(df: pd.DataFrame):
+        """Validate a price DataFrame before it is written."""
         # Validate input type first
         if not isinstance(df, pd.DataFrame):
             raise TypeError("Input must be a pandas DataFrame")
@@ -22,47 +30,250 @@ class PriceRepository:
         missing_cols = [col for col in required_cols if col not in df.columns]
         if missing_cols:
             raise ValueError(f"DataFrame missing required columns: {missing_cols}")
+    
+    @profiler.timed("repository.save_prices")
+    def save_prices(self, df: pd.DataFrame, log_revisions: bool = False) -> dict[str, PriceChangeSummary]:
+        """Upsert price data, writing only new or revised rows.
+        
+        Incoming rows are matched to stored rows on (ticker, date) and compared
+        by a hash of their values, so unchanged rows are never rewritten. With
+        ``log_revisions`` the old and new values of revised rows are recorded
+        in ``price_revisions``.
+        """
+        self._validate_prices(df)
         
         con = get_connection()
         try:
-            con.register("df", df)
+            self._stage_prices(con, [df])
+            con.execute("BEGIN TRANSACTION")
+            try:
+                if log_revisions:
+                    self._log_revisions(con)
+                con.execute(f"""
+                    INSERT OR REPLACE INTO prices
+                    SELECT {VALUE_COLUMNS} FROM staging_changes
+                    WHERE change <> 'unchanged'
+                """)
+                refresh_aggregates(con, "touched_dates")
+                con.execute("COMMIT")
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
+            return self._change_summary(con)
+        finally:
+            con.close()
+    
+    @profiler.timed("repository.bulk_save_prices")
+    def bulk_save_prices(self, frames: list[pd.DataFrame], defer_index: bool = False,
+                         log_revisions: bool = False) -> BulkLoadStats:
+        """Replace the date ranges covered by many price frames in one transaction.
+        
+        All frames are staged into a temporary table first, so the whole batch
+        costs one set-based delete+insert instead of one upsert per ticker.
+        Only new, revised and vanished rows are touched. With ``defer_index``
+        the prices table is rebuilt without its primary key and the key is
+        added once after the load, which is much cheaper for full reloads than
+        maintaining the index row by row.
+        """
+        if not isinstance(frames, list) or not frames:
+            raise ValueError("frames must be a non-empty list of DataFrames")
+        for df in frames:
+            self._validate_prices(df)
+        
+        started = time.perf_counter()
+        con = get_connection()
+        try:
+            self._stage_prices(con, frames)
             con.execute("""
-                INSERT OR REPLACE INTO prices
-                SELECT * FROM df
+                CREATE OR REPLACE TEMP TABLE staging_ranges AS
+                SELECT ticker, MIN(date) AS first_date, MAX(date) AS last_date
+                FROM staging_prices
+                GROUP BY ticker
             """)
+            # Rows that vanished upstream also change their weekly/monthly bars
+            con.execute("""
+                INSERT INTO touched_dates
+                SELECT p.ticker, p.date FROM prices p
+                JOIN staging_ranges r ON r.ticker = p.ticker
+                 AND p.date BETWEEN r.first_date AND r.last_date
+                ANTI JOIN staging_prices s ON s.ticker = p.ticker AND s.date = p.date
+            """)
+            rows, tickers = con.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT ticker) FROM staging_prices"
+            ).fetchone()
+            
+            con.execute("BEGIN TRANSACTION")
+            try:
+                if log_revisions:
+                    self._log_revisions(con)
+                if defer_index:
+                    self._rebuild_prices(con)
+                else:
+                    # Drop revised rows and rows that vanished upstream, keep unchanged ones
+                    con.execute("""
+                        DELETE FROM prices USING staging_ranges r
+                        WHERE prices.ticker = r.ticker
+                          AND prices.date BETWEEN r.first_date AND r.last_date
+                          AND NOT EXISTS (
+                              SELECT 1 FROM staging_changes c
+                              WHERE c.ticker = prices.ticker
+                                AND c.date = prices.date
+                                AND c.change = 'unchanged'
+                          )
+                    """)
+                    con.execute(f"""
+                        INSERT INTO prices
+                        SELECT {VALUE_COLUMNS} FROM staging_changes
+                        WHERE change <> 'unchanged'
+                        ORDER BY ticker, date
+                    """)
+                refresh_aggregates(con, "touched_dates")
+                con.execute("COMMIT")
+            except Exception:
+                con.execute("ROLLBACK")
+                raise
+            changes = self._change_summary(con)
         finally:
             con.close()
+        
+        return BulkLoadStats(rows=rows, tickers=tickers, seconds=time.perf_counter() - started,
+                             changes=changes)
+    
+    @staticmethod
+    @profiler.timed("repository.stage_prices")
+    def _stage_prices(con, frames: list[pd.DataFrame]):
+        """Stage frames into temp tables and classify each row against stored prices."""
+        staged = pd.concat(frames, ignore_index=True).reindex(columns=PRICE_COLUMNS)
+        con.register("incoming", staged)
+        con.execute("""
+            CREATE OR REPLACE TEMP TABLE staging_prices AS
+            SELECT ticker, CAST(date AS DATE) AS date,
+                   CAST(open AS DOUBLE) AS open, CAST(high AS DOUBLE) AS high,
+                   CAST(low AS DOUBLE) AS low, CAST(close AS DOUBLE) AS close,
+                   CAST(adj_close AS DOUBLE) AS adj_close, CAST(volume AS BIGINT) AS volume
+            FROM incoming
+            QUALIFY row_number() OVER (PARTITION BY ticker, CAST(date AS DATE)) = 1
+        """)
+        con.unregister("incoming")
+        con.execute(f"""
+            CREATE OR REPLACE TEMP TABLE staging_changes AS
+            SELECT s.*,
+                   CASE
+                       WHEN p.date IS NULL THEN 'new'
+                       WHEN hash(s.open, s.high, s.low, s.close, s.adj_close, s.volume)
+                          = hash(p.open, p.high, p.low, p.close, p.adj_close, p.volume) THEN 'unchanged'
+                       ELSE 'updated'
+                   END AS change,
+                   {", ".join(f"p.{col} AS old_{col}" for col in VALUE_FIELDS)}
+            FROM staging_prices s
+            LEFT JOIN prices p ON p.ticker = s.ticker AND p.date = s.date
+        """)
+        con.execute("""
+            CREATE OR REPLACE TEMP TABLE touched_dates AS
+            SELECT ticker, date FROM staging_changes WHERE change <> 'unchanged'
+        """)
     
-    def load_prices(self, ticker: str) -> pd.DataFrame:
-        """Load price data for a ticker."""
+    @staticmethod
+    def _log_revisions(con):
+        """Record old and new values of staged rows that revise stored ones."""
+        con.execute(f"""
+            INSERT INTO price_revisions
+            SELECT ticker, date, current_timestamp,
+                   {", ".join(f"old_{col}" for col in VALUE_FIELDS)},
+                   {", ".join(VALUE_FIELDS)}
+            FROM staging_changes
+            WHERE change = 'updated'
+        """)
+    
+    @staticmethod
+    def _change_summary(con) -> dict[str, PriceChangeSummary]:
+        """Count new, updated and unchanged staged rows per ticker."""
+        rows = con.execute("""
+            SELECT ticker,
+                   COUNT(*) FILTER (WHERE change = 'new'),
+                   COUNT(*) FILTER (WHERE change = 'updated'),
+                   COUNT(*) FILTER (WHERE change = 'unchanged')
+            FROM staging_changes
+            GROUP BY ticker
+            ORDER BY ticker
+        """).fetchall()
+        return {
+            ticker: PriceChangeSummary(ticker=ticker, new=new, updated=updated, unchanged=unchanged)
+            for ticker, new, updated, unchanged in rows
+        }
+    
+    @staticmethod
+    def _rebuild_prices(con):
+        """Swap in a sorted copy of prices with staged ranges replaced, indexing once at the end."""
+        con.execute("DROP TABLE IF EXISTS prices_rebuild")
+        create_prices_table(con, "prices_rebuild", primary_key=False)
+        con.execute("""
+            INSERT INTO prices_rebuild
+            SELECT * FROM (
+                SELECT p.* FROM prices p
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM staging_ranges r
+                    WHERE r.ticker = p.ticker
+                      AND p.date BETWEEN r.first_date AND r.last_date
+                )
+                UNION ALL
+                SELECT * FROM staging_prices
+            )
+            ORDER BY ticker, date
+        """)
+        con.execute("ALTER TABLE prices_rebuild ADD PRIMARY KEY (ticker, date)")
+        con.execute("DROP TABLE prices")
+        con.execute("ALTER TABLE prices_rebuild RENAME TO prices")
+    
+    @profiler.timed("repository.load_prices")
+    def load_prices(self, ticker: str, frequency: str = 'daily') -> pd.DataFrame:
+        """Load price data for a ticker.
+        
+        ``frequency`` may be ``'weekly'`` or ``'monthly'`` to read the derived
+        bars instead (first open, high, low, last close/adj_close and total
+        volume per period, dated on the period's last trading day).
+        """
+        if frequency == 'daily':
+            table = 'prices'
+        elif frequency in AGGREGATE_TABLES:
+            table = AGGREGATE_TABLES[frequency][0]
+        else:
+            raise ValueError(f"Unknown frequency: {frequency}")
+        
         con = get_connection()
         try:
-            df = con.execute(
-                "SELECT * FROM prices WHERE ticker = ? ORDER BY date",
-                [ticker]
+            df = profiler.execute(
+                con, f"SELECT {VALUE_COLUMNS} FROM {table} WHERE ticker = ? ORDER BY date",
+                [ticker], name=f"sql.load_prices.{frequency}"
             ).df()
             df['date'] = pd.to_datetime(df['date'])
             return df
         finally:
             con.close()
     
+    @profiler.timed("repository.get_latest_date")
     def get_latest_date(self, ticker: str) -> str | None:
         """Get the latest date for a ticker in the database."""
         con = get_connection()
         try:
-            result = con.execute(
-                "SELECT MAX(date) FROM prices WHERE ticker = ?", 
-                [ticker]
+            result = profiler.execute(
+                con, "SELECT MAX(date) FROM prices WHERE ticker = ?",
+                [ticker], name="sql.get_latest_date"
             ).fetchone()
             return result[0] if result and result[0] else None
         finally:
             con.close()
     
-    def get_available_tickers(self) -> list[str]:
-        """Get list of available tickers in database."""
+    @profiler.timed("repository.get_available_tickers")
+    def get_available_tickers(self, include_fx: bool = False) -> list[str]:
+        """Get list of available tickers in database (FX rate series excluded by default)."""
+        where = "" if include_fx else "WHERE ticker NOT LIKE '%=X'"
         con = get_connection()
         try:
-            result = con.execute("SELECT DISTINCT ticker FROM prices ORDER BY ticker").fetchall()
+            result = profiler.execute(
+                con, f"SELECT DISTINCT ticker FROM prices {where} ORDER BY ticker",
+                name="sql.get_available_tickers"
+            ).fetchall()
             return [row[0] for row in result]
         finally:
             con.close()
\ No newline at end of file
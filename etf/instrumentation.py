@@ -0,0 +1,179 @@
+import atexit
+import functools
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime
+
+_DISABLED_SPAN = nullcontext()
+
+
+@dataclass
+class TimingStats:
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "min_ms": self.min * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+        }
+
+
+class _Span:
+    """Context manager timing one named block."""
+
+    __slots__ = ("profiler", "name", "started")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.started)
+        return False
+
+
+class Profiler:
+    """Collects timing aggregates for named spans and a log of slow queries.
+
+    Disabled by default (enable with ``ETF_PROFILE=1`` or ``enable()``); when
+    disabled, spans, decorated functions and traced queries cost a single
+    flag check.
+    """
+
+    def __init__(self, enabled: bool = False, slow_query_seconds: float = 0.25,
+                 max_slow_queries: int = 50):
+        self.enabled = enabled
+        self.slow_query_seconds = slow_query_seconds
+        self.slow_queries = deque(maxlen=max_slow_queries)
+        self._stats: dict[str, TimingStats] = {}
+        self._lock = threading.Lock()
+        self._report_registered = False
+
+    def enable(self, report_at_exit: bool = False):
+        """Start collecting timings, optionally printing a report when the process exits."""
+        self.enabled = True
+        if report_at_exit and not self._report_registered:
+            atexit.register(lambda: print(self.report()))
+            self._report_registered = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self.slow_queries.clear()
+
+    def record(self, name: str, seconds: float):
+        """Add one timing sample to the aggregate for ``name``."""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = TimingStats()
+            stats.add(seconds)
+
+    def span(self, name: str):
+        """Context manager timing the enclosed block under ``name``."""
+        return _Span(self, name) if self.enabled else _DISABLED_SPAN
+
+    def timed(self, name: str | None = None):
+        """Decorator timing every call of the wrapped function."""
+        def decorator(func):
+            label = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(label, time.perf_counter() - started)
+            return wrapper
+        return decorator
+
+    def execute(self, con, sql: str, params: list | None = None, name: str = "query"):
+        """Execute a query on ``con``, timing it and logging its plan when slow.
+
+        Slow read queries are re-run under ``EXPLAIN ANALYZE`` on a separate
+        cursor so the caller's pending result is left untouched.
+        """
+        if not self.enabled:
+            return con.execute(sql, params) if params is not None else con.execute(sql)
+        started = time.perf_counter()
+        result = con.execute(sql, params) if params is not None else con.execute(sql)
+        seconds = time.perf_counter() - started
+        self.record(name, seconds)
+        if seconds >= self.slow_query_seconds:
+            self._log_slow_query(con, sql, params, name, seconds)
+        return result
+
+    def _log_slow_query(self, con, sql: str, params: list | None, name: str, seconds: float):
+        plan = None
+        if sql.lstrip().upper().startswith(("SELECT", "WITH")):
+            cursor = con.cursor()
+            try:
+                rows = cursor.execute(f"EXPLAIN ANALYZE {sql}", params).fetchall()
+                plan = "\n".join(row[-1] for row in rows)
+            except Exception as e:
+                plan = f"EXPLAIN ANALYZE failed: {e}"
+            finally:
+                cursor.close()
+        self.slow_queries.append({
+            "name": name,
+            "seconds": seconds,
+            "sql": " ".join(sql.split()),
+            "params": [str(p) for p in params] if params else [],
+            "plan": plan,
+            "logged_at": datetime.now().isoformat(timespec="seconds"),
+        })
+
+    def snapshot(self) -> dict:
+        """Get aggregates and slow queries as plain data."""
+        with self._lock:
+            spans = {name: stats.as_dict() for name, stats in sorted(self._stats.items())}
+            slow = list(self.slow_queries)
+        return {"enabled": self.enabled, "spans": spans, "slow_queries": slow}
+
+    def report(self) -> str:
+        """Format aggregates as a table sorted by total time."""
+        snapshot = self.snapshot()
+        lines = ["", "=== Profile ===",
+                 f"{'span':<45} {'count':>7} {'total ms':>11} {'mean ms':>10} {'max ms':>10}"]
+        spans = sorted(snapshot["spans"].items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        for name, stats in spans:
+            lines.append(f"{name:<45} {stats['count']:>7} {stats['total_ms']:>11.1f} "
+                         f"{stats['mean_ms']:>10.2f} {stats['max_ms']:>10.1f}")
+        if snapshot["slow_queries"]:
+            lines.append(f"\n{len(snapshot['slow_queries'])} slow queries "
+                         f"(>= {self.slow_query_seconds * 1000:.0f} ms):")
+            for query in snapshot["slow_queries"]:
+                lines.append(f"  [{query['seconds'] * 1000:.1f} ms] {query['name']}: {query['sql']}")
+        return "\n".join(lines)
+
+
+profiler = Profiler(
+    enabled=os.environ.get("ETF_PROFILE", "") not in ("", "0"),
+    slow_query_seconds=float(os.environ.get("ETF_SLOW_QUERY_MS", "250")) / 1000,
+)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 from typing import Optional
 
@@ -24,4 +24,28 @@ class PerformanceMetrics:
     sharpe_ratio: float
     max_drawdown: float
     period_start: date
-    period_end: date
\ No newline at end of file
+    period_end: date
+
+
+@dataclass
+class PriceChangeSummary:
+    ticker: str
+    new: int
+    updated: int
+    unchanged: int
+
+    @property
+    def changed(self) -> bool:
+        return self.new > 0 or self.updated > 0
+
+
+@dataclass
+class BulkLoadStats:
+    rows: int
+    tickers: int
+    seconds: float
+    changes: dict[str, PriceChangeSummary] = field(default_factory=dict)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
@@ -3,6 +3,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import List, Dict, Optional
+from etf.instrumentation import profiler
 
 
 class ETFVisualizer:
@@ -12,6 +13,7 @@ class ETFVisualizer:
         self.figsize = figsize
         plt.style.use('default')
     
+    @profiler.timed("charts.plot_price_history")
     def plot_price_history(self, df: pd.DataFrame, ticker: str, save_path: Optional[str] = None):
         """Plot price history for a single ETF."""
         fig, ax = plt.subplots(figsize=self.figsize)
@@ -30,6 +32,7 @@ class ETFVisualizer:
         
         return fig
     
+    @profiler.timed("charts.plot_returns_comparison")
     def plot_returns_comparison(self, data: Dict[str, pd.DataFrame], save_path: Optional[str] = None):
         """Plot cumulative returns comparison for multiple ETFs."""
         fig, ax = plt.subplots(figsize=self.figsize)
@@ -52,6 +55,7 @@ class ETFVisualizer:
         
         return fig
     
+    @profiler.timed("charts.plot_risk_return_scatter")
     def plot_risk_return_scatter(self, metrics: Dict[str, Dict], save_path: Optional[str] = None):
         """Plot risk-return scatter chart."""
         fig, ax = plt.subplots(figsize=self.figsize)
@@ -78,6 +82,7 @@ class ETFVisualizer:
         
         return fig
     
+    @profiler.timed("charts.plot_performance_dashboard")
     def plot_performance_dashboard(self, ticker: str, df: pd.DataFrame, metrics: Dict, 
                                  save_path: Optional[str] = None):
         """Create comprehensive performance dashboard."""
@@ -131,6 +136,7 @@ class ETFVisualizer:
         
         return fig
     
+    @profiler.timed("charts.save_chart")
     def save_chart(self, fig, filename: str):
         """Save chart with timestamp."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Database check script using new class-based architecture."""
+"""Database check script (same as ``etf check``)."""
 
 import sys
 from pathlib import Path
@@ -8,41 +8,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from etf.data.repository import PriceRepository
-
-
-def main():
-    """Check database contents."""
-    try:
-        repo = PriceRepository()
-        
-        # Check row counts and cache data
-        tickers = repo.get_available_tickers()
-        if not tickers:
-            print("No data found in database.")
-            return
-        
-        # Load data once and cache it
-        ticker_data = {}
-        print("Row counts by ticker:")
-        for ticker in tickers:
-            df = repo.load_prices(ticker)
-            ticker_data[ticker] = df
-            print(f"  {ticker}: {len(df)}")
-        
-        # Show recent data using cached data
-        print("\nRecent data (last 5 records):")
-        for ticker in list(ticker_data.keys())[:3]:  # Show only first 3 tickers
-            df = ticker_data[ticker]
-            if not df.empty:
-                recent = df.tail(5)
-                print(f"\n{ticker}:")
-                for _, row in recent.iterrows():
-                    print(f"  {row['date'].date()} ${row['close']:.2f}")
-    
-    except Exception as e:
-        print(f"Error checking database: {e}")
-
+from etf.cli import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main(["check", *sys.argv[1:]]))
@@ -1,18 +1,14 @@
 #!/usr/bin/env python3
-"""Check metadata table contents."""
+"""Check metadata table contents (same as ``etf metadata show``)."""
 
 import sys
 from pathlib import Path
 
+# Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from storage.db import get_connection
+from etf.cli import main
 
-con = get_connection()
-try:
-    result = con.execute("SELECT ticker, isin, description FROM etf_metadata LIMIT 10").fetchall()
-    for row in result:
-        print(f"{row[0]}: ISIN={row[1]}, DESC={row[2]}")
-finally:
-    con.close()
+if __name__ == "__main__":
+    sys.exit(main(["metadata", "show", *sys.argv[1:]]))
@@ -1,22 +1,88 @@
 from storage.db import get_connection
 
+# Derived bar tables: frequency -> (table, date_trunc unit)
+AGGREGATE_TABLES = {
+    'weekly': ('prices_weekly', 'week'),
+    'monthly': ('prices_monthly', 'month'),
+}
+
+
+def create_prices_table(con, name: str = "prices", primary_key: bool = True):
+    """Create a daily prices table, optionally without its primary key index."""
+    key = ",\n            PRIMARY KEY (ticker, date)" if primary_key else ""
+    con.execute(f"""
+        CREATE TABLE IF NOT EXISTS {name} (
+            ticker TEXT,
+            date DATE,
+            open DOUBLE,
+            high DOUBLE,
+            low DOUBLE,
+            close DOUBLE,
+            adj_close DOUBLE,
+            volume BIGINT{key}
+        )
+    """)
+
+
+def refresh_aggregates(con, touched: str | None = None):
+    """Recompute weekly and monthly bars from prices.
+
+    Only periods containing a (ticker, date) row of the ``touched`` table
+    are rebuilt; all periods are rebuilt when it is None.
+    """
+    for table, unit in AGGREGATE_TABLES.values():
+        period = f"CAST(date_trunc('{unit}', p.date) AS DATE)"
+        if touched is None:
+            con.execute(f"DELETE FROM {table}")
+            scope = ""
+        else:
+            con.execute(f"""
+                CREATE OR REPLACE TEMP TABLE touched_periods AS
+                SELECT DISTINCT p.ticker, {period} AS period_start FROM {touched} p
+            """)
+            con.execute(f"""
+                DELETE FROM {table} USING touched_periods t
+                WHERE {table}.ticker = t.ticker AND {table}.period_start = t.period_start
+            """)
+            scope = f"JOIN touched_periods t ON t.ticker = p.ticker AND t.period_start = {period}"
+        con.execute(f"""
+            INSERT INTO {table}
+            SELECT p.ticker, {period} AS period_start, MAX(p.date) AS date,
+                   arg_min(p.open, p.date), MAX(p.high), MIN(p.low),
+                   arg_max(p.close, p.date), arg_max(p.adj_close, p.date), SUM(p.volume)
+            FROM prices p {scope}
+            GROUP BY 1, 2
+            ORDER BY 1, 2
+        """)
+
+
 def ensure_schema():
     con = get_connection()
     try:
-        con.execute("""
-            CREATE TABLE IF NOT EXISTS prices (
-                ticker TEXT,
-                date DATE,
-                open DOUBLE,
-                high DOUBLE,
-                low DOUBLE,
-                close DOUBLE,
-                adj_close DOUBLE,
-                volume BIGINT,
-                PRIMARY KEY (ticker, date)
-            )
-        """)
-        
+        create_prices_table(con)
+
+        backfill = con.execute(
+            "SELECT COUNT(*) = 0 FROM duckdb_tables() WHERE table_name = 'prices_monthly'"
+        ).fetchone()[0]
+        for table, _ in AGGREGATE_TABLES.values():
+            con.execute(f"""
+                CREATE TABLE IF NOT EXISTS {table} (
+                    ticker TEXT,
+                    period_start DATE,
+                    date DATE,
+                    open DOUBLE,
+                    high DOUBLE,
+                    low DOUBLE,
+                    close DOUBLE,
+                    adj_close DOUBLE,
+                    volume BIGINT,
+                    PRIMARY KEY (ticker, period_start)
+                )
+            """)
+        if backfill:
+            # Existing databases get their aggregates built once on upgrade
+            refresh_aggregates(con)
+
         con.execute("""
             CREATE TABLE IF NOT EXISTS etf_metadata (
                 ticker TEXT PRIMARY KEY,
@@ -29,5 +95,61 @@ def ensure_schema():
                 description TEXT
             )
         """)
+
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS price_revisions (
+                ticker TEXT,
+                date DATE,
+                revised_at TIMESTAMP,
+                old_open DOUBLE,
+                old_high DOUBLE,
+                old_low DOUBLE,
+                old_close DOUBLE,
+                old_adj_close DOUBLE,
+                old_volume BIGINT,
+                new_open DOUBLE,
+                new_high DOUBLE,
+                new_low DOUBLE,
+                new_close DOUBLE,
+                new_adj_close DOUBLE,
+                new_volume BIGINT
+            )
+        """)
+
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS exchange_calendars (
+                exchange TEXT,
+                date DATE,
+                PRIMARY KEY (exchange, date)
+            )
+        """)
+
+        con.execute("CREATE SEQUENCE IF NOT EXISTS ingestion_run_seq START 1")
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS ingestion_runs (
+                run_id INTEGER PRIMARY KEY,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP,
+                status TEXT,
+                incremental BOOLEAN,
+                ticker_count INTEGER
+            )
+        """)
+
+        con.execute("""
+            CREATE TABLE IF NOT EXISTS ingestion_tasks (
+                run_id INTEGER,
+                ticker TEXT,
+                status TEXT,
+                attempts INTEGER,
+                rows_written BIGINT,
+                started_at TIMESTAMP,
+                finished_at TIMESTAMP,
+                duration_seconds DOUBLE,
+                next_attempt_at TIMESTAMP,
+                last_error TEXT,
+                PRIMARY KEY (run_id, ticker)
+            )
+        """)
     finally:
         con.close()
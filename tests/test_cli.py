@@ -0,0 +1,54 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+HEAVY_MODULES = ('pandas', 'matplotlib', 'yfinance')
+# Generous wall-clock budget for importing the CLI and building its parser
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+def run_python(code: str, cwd: str | None = None) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=cwd or PROJECT_ROOT,
+        capture_output=True, text=True, check=True,
+        env={"PYTHONPATH": str(PROJECT_ROOT), "PATH": ""}
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+class TestCliStartup(unittest.TestCase):
+    
+    def test_parser_import_budget(self):
+        output = run_python(
+            "import sys, time\n"
+            "started = time.perf_counter()\n"
+            "import etf.cli\n"
+            "etf.cli.build_parser()\n"
+            "elapsed = time.perf_counter() - started\n"
+            f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+            "print(elapsed, ','.join(heavy))"
+        )
+        elapsed, _, heavy = output.partition(' ')
+        self.assertEqual(heavy, '')
+        self.assertLess(float(elapsed), IMPORT_BUDGET_SECONDS)
+    
+    def test_check_avoids_heavy_imports(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = run_python(
+                "import sys\n"
+                "from unittest import mock\n"
+                "from pathlib import Path\n"
+                "from etf.cli import main\n"
+                "with mock.patch('storage.db.DB_PATH', Path('etf.duckdb')):\n"
+                "    main(['check'])\n"
+                f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules) or 'none')",
+                cwd=tmp
+            )
+        self.assertEqual(output, 'none')
+
+
+if __name__ == '__main__':
+    unittest.main()
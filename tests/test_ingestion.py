@@ -0,0 +1,72 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import pandas as pd
+from etf.data.ingestion import YahooFinanceIngester
+from etf.data.manifest import IngestionManifest
+
+
+class FlakyIngester(YahooFinanceIngester):
+    """Ingester serving canned prices, failing the first ``failures`` fetches per ticker."""
+    
+    def __init__(self, failures: dict[str, int]):
+        super().__init__(delay=0, max_attempts=3, retry_base_delay=0.0)
+        self.failures = dict(failures)
+        self.fetched = []
+    
+    def fetch_prices(self, ticker, period="10y", start_date=None, raise_errors=False):
+        self.fetched.append(ticker)
+        if self.failures.get(ticker, 0) > 0:
+            self.failures[ticker] -= 1
+            raise ConnectionError("upstream unavailable")
+        return pd.DataFrame({
+            'ticker': ticker,
+            'date': ['2023-01-02', '2023-01-03'],
+            'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'adj_close': 1.0,
+            'volume': 100
+        })
+
+
+class TestResumableIngestion(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch('storage.db.DB_PATH', Path(self.tmp.name) / 'etf.duckdb')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+    
+    def test_transient_failures_are_retried(self):
+        ingester = FlakyIngester({'VEA': 2})
+        changes = ingester.ingest_tickers(['SPY', 'VEA'], incremental=False)
+        self.assertEqual(sorted(changes), ['SPY', 'VEA'])
+        self.assertEqual(ingester.fetched.count('VEA'), 3)
+        
+        manifest = IngestionManifest()
+        self.assertEqual(manifest.task_summary(ingester.last_run_id), {'succeeded': 2})
+        self.assertEqual(manifest.get_run(ingester.last_run_id)['status'], 'completed')
+    
+    def test_resume_only_fetches_outstanding_tickers(self):
+        ingester = FlakyIngester({'VEA': 5})
+        ingester.ingest_tickers(['SPY', 'VEA'], incremental=False)
+        run_id = ingester.last_run_id
+        manifest = IngestionManifest()
+        self.assertEqual(manifest.task_summary(run_id), {'failed': 1, 'succeeded': 1})
+        self.assertEqual(manifest.latest_unfinished_run(), run_id)
+        
+        resumed = FlakyIngester({})
+        changes = resumed.resume_run()
+        self.assertEqual(resumed.fetched, ['VEA'])
+        self.assertEqual(list(changes), ['VEA'])
+        self.assertEqual(manifest.get_run(run_id)['status'], 'completed')
+    
+    def test_bulk_run_completes_staged_tasks(self):
+        ingester = FlakyIngester({'SPY': 1})
+        changes = ingester.ingest_tickers(['SPY', 'VEA'], incremental=False, bulk=True, batch_size=1)
+        self.assertEqual(changes['SPY'].new, 2)
+        self.assertEqual(IngestionManifest().task_summary(ingester.last_run_id), {'succeeded': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import duckdb
+from etf.instrumentation import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    
+    def test_disabled_profiler_records_nothing(self):
+        profiler = Profiler()
+        
+        @profiler.timed("work")
+        def work():
+            return 42
+        
+        self.assertEqual(work(), 42)
+        with profiler.span("block"):
+            pass
+        self.assertEqual(profiler.snapshot()["spans"], {})
+    
+    def test_enabled_profiler_aggregates_spans(self):
+        profiler = Profiler(enabled=True)
+        
+        @profiler.timed("work")
+        def work():
+            return 42
+        
+        work()
+        work()
+        with profiler.span("block"):
+            pass
+        spans = profiler.snapshot()["spans"]
+        self.assertEqual(spans["work"]["count"], 2)
+        self.assertEqual(spans["block"]["count"], 1)
+        self.assertIn("work", profiler.report())
+    
+    def test_slow_query_log_captures_plan(self):
+        profiler = Profiler(enabled=True, slow_query_seconds=0.0)
+        con = duckdb.connect()
+        try:
+            rows = profiler.execute(con, "SELECT ? + 1", [1], name="sql.add").fetchall()
+        finally:
+            con.close()
+        self.assertEqual(rows, [(2,)])
+        slow = profiler.snapshot()["slow_queries"]
+        self.assertEqual(len(slow), 1)
+        self.assertEqual(slow[0]["name"], "sql.add")
+        self.assertIsNotNone(slow[0]["plan"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+import numpy as np
+import pandas as pd
+from etf.data.calendar import TradingCalendar
+from etf.data.fx import CurrencyConverter, fx_tickers_for
+from etf.data.panel import PanelLoader, forward_fill
+from etf.data.repository import PriceRepository
+from storage.db import get_connection
+
+
+def bars(ticker: str, dates: list[str], closes: list[float]) -> pd.DataFrame:
+    return pd.DataFrame({'ticker': ticker, 'date': dates, 'close': closes})
+
+
+class TestTradingCalendar(unittest.TestCase):
+    
+    def test_positions_mark_missing_dates(self):
+        calendar = TradingCalendar(['2023-01-04', '2023-01-02', '2023-01-03'])
+        positions = calendar.positions(['2023-01-03', '2023-01-05', '2023-01-02'])
+        self.assertEqual(positions.tolist(), [1, -1, 0])
+    
+    def test_forward_fill_respects_limit(self):
+        values = np.array([[np.nan], [1.0], [np.nan], [np.nan], [2.0]])
+        self.assertTrue(np.isnan(forward_fill(values)[0, 0]))
+        self.assertEqual(forward_fill(values)[3, 0], 1.0)
+        self.assertTrue(np.isnan(forward_fill(values, limit=1)[3, 0]))
+
+
+class TestPanelLoader(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch('storage.db.DB_PATH', Path(self.tmp.name) / 'etf.duckdb')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        
+        repo = PriceRepository()
+        # 2023-01-02 is a London holiday, 2023-01-16 a US one
+        repo.save_prices(bars('SPY', ['2023-01-02', '2023-01-03', '2023-01-17'], [100.0, 101.0, 102.0]))
+        repo.save_prices(bars('IWDA.L', ['2023-01-03', '2023-01-16', '2023-01-17'], [80.0, 81.0, 82.0]))
+        con = get_connection()
+        try:
+            con.execute("""
+                INSERT INTO etf_metadata (ticker, exchange) VALUES ('SPY', 'NYSE Arca'), ('IWDA.L', 'LSE')
+            """)
+        finally:
+            con.close()
+        self.loader = PanelLoader()
+    
+    def test_union_calendar_alignment(self):
+        panel = self.loader.load(['SPY', 'IWDA.L'], fill='none')
+        self.assertEqual([str(d) for d in panel.dates],
+                         ['2023-01-02', '2023-01-03', '2023-01-16', '2023-01-17'])
+        np.testing.assert_array_equal(panel.column('SPY'), [100.0, 101.0, np.nan, 102.0])
+        np.testing.assert_array_equal(panel.column('IWDA.L'), [np.nan, 80.0, 81.0, 82.0])
+    
+    def test_forward_fill_and_returns(self):
+        panel = self.loader.load(['SPY', 'IWDA.L'])
+        np.testing.assert_array_equal(panel.column('SPY'), [100.0, 101.0, 101.0, 102.0])
+        returns = panel.returns()
+        self.assertAlmostEqual(returns[1, 0], 0.01)
+        self.assertEqual(returns[2, 0], 0.0)
+    
+    def test_exchange_calendar(self):
+        panel = self.loader.load(['SPY', 'IWDA.L'], calendar='NYSE Arca', fill='none')
+        self.assertEqual(len(panel), 3)
+        np.testing.assert_array_equal(panel.column('IWDA.L'), [np.nan, 80.0, 82.0])
+    
+    def test_date_range_and_missing_ticker(self):
+        panel = self.loader.load(['VEA', 'SPY'], start='2023-01-03', fill='none')
+        self.assertEqual(panel.tickers, ['VEA', 'SPY'])
+        self.assertTrue(np.isnan(panel.column('VEA')).all())
+        self.assertEqual(str(panel.dates[0]), '2023-01-03')
+    
+    def test_invalid_field(self):
+        with self.assertRaises(ValueError):
+            self.loader.load(field='close; DROP TABLE prices')
+
+
+
+class TestCurrencyConverter(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch('storage.db.DB_PATH', Path(self.tmp.name) / 'etf.duckdb')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        
+        repo = PriceRepository()
+        dates = ['2023-01-03', '2023-01-04', '2023-01-05']
+        repo.save_prices(bars('SPY', dates, [100.0, 100.0, 100.0]))
+        repo.save_prices(bars('EUNL.DE', dates, [10.0, 10.0, 10.0]))
+        repo.save_prices(bars('VUKE.L', dates, [3000.0, 3000.0, 3000.0]))
+        # FX fixings include a day the ETFs did not trade; EUR fixes late on the 3rd
+        repo.save_prices(bars('EURUSD=X', ['2023-01-02', '2023-01-04'], [1.1, 1.2]))
+        repo.save_prices(bars('USDGBP=X', ['2023-01-02', '2023-01-03'], [0.8, 0.5]))
+        con = get_connection()
+        try:
+            con.execute("""
+                INSERT INTO etf_metadata (ticker, currency, exchange) VALUES
+                ('SPY', 'USD', 'NYSE Arca'), ('EUNL.DE', 'EUR', 'Xetra'), ('VUKE.L', 'GBp', 'LSE')
+            """)
+        finally:
+            con.close()
+    
+    def test_fx_tickers_for_currencies(self):
+        self.assertEqual(fx_tickers_for(['USD', 'GBp', 'GBP', 'EUR'], 'USD'), ['EURUSD=X', 'GBPUSD=X'])
+    
+    def test_convert_to_base_currency(self):
+        converter = CurrencyConverter('USD')
+        panel = converter.load(['SPY', 'EUNL.DE', 'VUKE.L'])
+        np.testing.assert_allclose(panel.column('SPY'), [100.0, 100.0, 100.0])
+        np.testing.assert_allclose(panel.column('EUNL.DE'), [11.0, 12.0, 12.0])
+        # GBp is scaled to GBP and converted through the inverted USDGBP pair
+        np.testing.assert_allclose(panel.column('VUKE.L'), [60.0, 60.0, 60.0])
+        self.assertIs(converter.load(['SPY', 'EUNL.DE', 'VUKE.L']), panel)
+    
+    def test_missing_fx_series(self):
+        with self.assertRaises(ValueError):
+            CurrencyConverter('CHF').load(['SPY'])
+
+
+if __name__ == '__main__':
+    unittest.main()
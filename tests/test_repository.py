@@ -1,6 +1,10 @@
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
 import pandas as pd
 from etf.data.repository import PriceRepository
+from storage.db import get_connection
 
 
 class TestPriceRepository(unittest.TestCase):
@@ -44,5 +48,96 @@ class TestPriceRepository(unittest.TestCase):
             self.fail(f"save_prices raised {e} unexpectedly")
 
 
+
+def make_prices(ticker: str, dates: list[str], close: float) -> pd.DataFrame:
+    return pd.DataFrame({
+        'ticker': ticker,
+        'date': dates,
+        'open': close,
+        'high': close,
+        'low': close,
+        'close': close,
+        'adj_close': close,
+        'volume': 1000
+    })
+
+
+class TempDatabaseTestCase(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch('storage.db.DB_PATH', Path(self.tmp.name) / 'etf.duckdb')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+        self.repo = PriceRepository()
+        self.repo.save_prices(make_prices('SPY', ['2023-01-02', '2023-01-03', '2023-01-04'], 1.0))
+
+
+class TestBulkSavePrices(TempDatabaseTestCase):
+    
+    def test_bulk_save_rejects_empty_batch(self):
+        with self.assertRaises(ValueError):
+            self.repo.bulk_save_prices([])
+    
+    def test_bulk_save_replaces_staged_range(self):
+        stats = self.repo.bulk_save_prices([
+            make_prices('SPY', ['2023-01-03', '2023-01-04', '2023-01-05'], 2.0),
+            make_prices('VEA', ['2023-01-03'], 3.0),
+        ])
+        self.assertEqual(stats.rows, 4)
+        self.assertEqual(stats.tickers, 2)
+        spy = self.repo.load_prices('SPY')
+        self.assertEqual(spy['close'].tolist(), [1.0, 2.0, 2.0, 2.0])
+        self.assertEqual(len(self.repo.load_prices('VEA')), 1)
+    
+    def test_bulk_save_with_deferred_index(self):
+        self.repo.bulk_save_prices(
+            [make_prices('SPY', ['2023-01-04', '2023-01-05'], 2.0)], defer_index=True
+        )
+        spy = self.repo.load_prices('SPY')
+        self.assertEqual(spy['close'].tolist(), [1.0, 1.0, 2.0, 2.0])
+        # Primary key must be back in place after the rebuild
+        con = get_connection()
+        try:
+            with self.assertRaises(Exception):
+                con.execute("INSERT INTO prices (ticker, date, close) VALUES ('SPY', '2023-01-05', 1.0)")
+        finally:
+            con.close()
+
+    
+    def test_bulk_save_reports_changes(self):
+        stats = self.repo.bulk_save_prices([
+            make_prices('SPY', ['2023-01-03', '2023-01-04', '2023-01-05'], 1.0),
+        ])
+        summary = stats.changes['SPY']
+        self.assertEqual((summary.new, summary.updated, summary.unchanged), (1, 0, 2))
+
+
+class TestChangeDetection(TempDatabaseTestCase):
+    
+    def test_unchanged_rows_are_skipped(self):
+        changes = self.repo.save_prices(make_prices('SPY', ['2023-01-03', '2023-01-04'], 1.0))
+        self.assertEqual(changes['SPY'].unchanged, 2)
+        self.assertFalse(changes['SPY'].changed)
+    
+    def test_revisions_are_counted_and_logged(self):
+        revised = make_prices('SPY', ['2023-01-04', '2023-01-05'], 1.0)
+        revised.loc[0, 'adj_close'] = 0.9
+        changes = self.repo.save_prices(revised, log_revisions=True)
+        summary = changes['SPY']
+        self.assertEqual((summary.new, summary.updated, summary.unchanged), (1, 1, 0))
+        self.assertEqual(self.repo.load_prices('SPY')['adj_close'].tolist(), [1.0, 1.0, 0.9, 1.0])
+        
+        con = get_connection()
+        try:
+            revisions = con.execute(
+                "SELECT ticker, old_adj_close, new_adj_close FROM price_revisions"
+            ).fetchall()
+        finally:
+            con.close()
+        self.assertEqual(revisions, [('SPY', 1.0, 0.9)])
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file